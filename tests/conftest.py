@@ -26,12 +26,45 @@ from pennylane.plugins import DefaultGaussian
 TOL = 1e-3
 TF_TOL = 2e-2
 
+def pytest_configure(config):
+    """Registers the custom markers of the test suite."""
+    config.addinivalue_line("markers", "torch: tests that require the PyTorch interface")
+    config.addinivalue_line("markers", "tf: tests that require the TensorFlow interface")
+    # provided by pytest-xdist if installed, registered here so that the marker is known without it
+    config.addinivalue_line("markers", "xdist_group(name): run tests of the same group on the same worker")
+
+
+def pytest_addoption(parser):
+    """Adds the custom command line options of the test suite."""
+    parser.addoption("--fast-grad", action="store_true", default=False,
+                     help="only differentiate with respect to the first trainable argument "
+                          "in the torch and tf template gradient tests; has no effect "
+                          "unless --full-grad-interfaces is also set")
+    parser.addoption("--full-grad-interfaces", action="store_true", default=False,
+                     help="compute gradients in the torch and tf template gradient tests, "
+                          "instead of only evaluating their circuits and skipping them; "
+                          "combine with --fast-grad to only differentiate the first argument")
+
+
 class DummyDevice(DefaultGaussian):
     """Dummy device to allow Kerr operations"""
     _operation_map = DefaultGaussian._operation_map.copy()
     _operation_map['Kerr'] = lambda *x, **y: np.identity(2)
 
 
+@pytest.fixture(scope="session")
+def fast_grad(request):
+    """Whether the ``--fast-grad`` command line option is set."""
+    return request.config.getoption("--fast-grad")
+
+
+@pytest.fixture(scope="session")
+def skip_heavy_grad(request):
+    """Whether the torch and tf template gradient tests only evaluate their circuits,
+    which is the case unless the ``--full-grad-interfaces`` command line option is set."""
+    return not request.config.getoption("--full-grad-interfaces")
+
+
 @pytest.fixture(scope="session")
 def tol():
     """Numerical tolerance for equality tests."""
@@ -99,11 +132,6 @@ def gaussian_device(n_subsystems):
     """Number of qubits or modes."""
     return DummyDevice(wires=n_subsystems)
 
-@pytest.fixture(scope="session")
-def gaussian_dummy():
-    """Number of qubits or modes."""
-    return DummyDevice
-
 @pytest.fixture(scope="session")
 def gaussian_device_2_wires():
     """A 2-mode Gaussian device."""
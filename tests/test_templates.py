@@ -19,8 +19,9 @@ and using different interfaces.
 
 New tests are added as follows:
 
-* When adding a new interface, try to import it and extend the fixture ``interfaces``. Also add the interface
-  gradient computation to the TestGradientIntegration tests.
+* When adding a new interface, check whether it is installed and extend the fixtures ``INTERFACES`` and
+  ``GRADIENT_INTERFACES``, marking the entries with the interface's marker (registered in ``conftest.py``).
+  Also add the interface gradient computation to the TestGradientIntegration tests.
 
 * When adding a new template, extend the fixtures ``QUBIT_CONSTANT_INPUT`` or ``CV_CONSTANT_INPUT``
   by a *list* of arguments to the
@@ -30,7 +31,11 @@ New tests are added as follows:
 ``cv_func``.
 
 """
-# pylint: disable=protected-access,cell-var-from-loop
+# pylint: disable=protected-access,cell-var-from-loop,import-outside-toplevel
+import importlib.util
+import sys
+import warnings
+
 import pytest
 import numpy as np
 import pennylane as qml
@@ -58,34 +63,86 @@ from pennylane.init import (strong_ent_layers_uniform,
 #######################################
 # Interfaces
 
-INTERFACES = [('numpy', np.array)]
+# markers of the rows of each interface; the xdist groups let ``pytest -n <workers> --dist loadgroup``
+# run the rows of different interfaces on separate workers
+NUMPY_MARKS = [pytest.mark.xdist_group(name="numpy")]
+TORCH_MARKS = [pytest.mark.torch, pytest.mark.xdist_group(name="torch")]
+TF_MARKS = [pytest.mark.tf, pytest.mark.xdist_group(name="tf")]
 
-try:
-    import torch
-    from torch.autograd import Variable as TorchVariable
+# interfaces and input conversion for circuits that are only executed
+INTERFACES = [pytest.param('numpy', np.asarray, marks=NUMPY_MARKS, id='numpy')]
+# interfaces and input conversion for circuits that are differentiated
+GRADIENT_INTERFACES = [pytest.param('numpy', np.asarray, marks=NUMPY_MARKS, id='numpy')]
 
-    INTERFACES.append(('torch', torch.tensor))
-except ImportError as e:
-    pass
 
-try:
+def import_tf():
+    """Imports TensorFlow, enabling eager execution for TensorFlow 1."""
     import tensorflow as tf
 
+    if tf.__version__[0] == "1":
+        tf.enable_eager_execution()
+    return tf
+
+
+def to_torch(inp):
+    """Converts an input to a torch tensor, sharing memory with NumPy arrays."""
+    import torch
+
+    with warnings.catch_warnings():
+        # the shared inputs are read-only arrays, which the tests never write to
+        warnings.filterwarnings("ignore", message="The given NumPy array is not writ(e)?able")
+        return torch.as_tensor(inp)
+
+
+def to_tf_constant(inp):
+    """Converts an input to a TensorFlow constant."""
+    return import_tf().constant(inp)
+
+
+def to_tf_variable(inp):
+    """Converts an input to a trainable TensorFlow variable."""
+    tf = import_tf()
+
     if tf.__version__[0] == "1":
         import tensorflow.contrib.eager as tfe
 
-        tf.enable_eager_execution()
-        TFVariable = tfe.Variable
-    else:
-        from tensorflow import Variable as TFVariable
-    INTERFACES.append(('tf', TFVariable))
+        return tfe.Variable(inp)
+    return tf.Variable(inp)
+
+
+# Only check whether torch and tensorflow are installed, since importing them is expensive.
+# They are imported by the functions above when a test first uses them, so that runs
+# deselecting their rows (e.g., ``pytest -m "not tf and not torch"``) never load them.
+if importlib.util.find_spec("torch") is not None:
+    INTERFACES.append(pytest.param('torch', to_torch, marks=TORCH_MARKS, id='torch'))
+    GRADIENT_INTERFACES.append(pytest.param('torch', to_torch, marks=TORCH_MARKS, id='torch'))
+
+if importlib.util.find_spec("tensorflow") is not None:
+    # constants avoid the cost of creating resource variables when no gradient is taken
+    INTERFACES.append(pytest.param('tf', to_tf_constant, marks=TF_MARKS, id='tf'))
+    GRADIENT_INTERFACES.append(pytest.param('tf', to_tf_variable, marks=TF_MARKS, id='tf'))
 
-except ImportError as e:
-    pass
+# inputs converted by an interface, keyed by the conversion function and the id of the input
+_CONVERTED = {}
+
+
+def convert(to_var, inp):
+    """Converts ``inp`` with ``to_var``, reusing the result of earlier conversions of the same object.
+
+    The parametrized tests combine the same constant inputs in many rows, so each input only has
+    to be converted once per interface."""
+    key = (to_var, id(inp))
+    if key not in _CONVERTED:
+        # keep a reference to the input, so that its id cannot be reused by another object
+        _CONVERTED[key] = (inp, to_var(inp))
+    return _CONVERTED[key][1]
 
 #########################################
 # Parameters shared between test classes
 
+# wires of the 2-wire circuits, created once for all tests
+WIRES = tuple(range(2))
+
 # qubit templates, constant args and kwargs for 2 wires
 QUBIT_CONSTANT_INPUT = [(StronglyEntanglingLayers, [[[[4.54, 4.79, 2.98], [4.93, 4.11, 5.58]],
                                                      [[6.08, 5.94, 0.05], [2.44, 5.07, 0.95]]]], {}),
@@ -113,14 +170,87 @@ CV_CONSTANT_INPUT = [(DisplacementEmbedding, [[1., 2.]], {}),
                      ]
 
 
+def _frozen(arg):
+    """Returns ``arg`` as a contiguous read-only array, which is safe to share between test cases."""
+    arr = np.ascontiguousarray(arg)
+    arr.flags.writeable = False
+    return arr
+
+
+def _to_arrays(inputs):
+    """Converts the nested-list arguments of each template in ``inputs`` to frozen arrays,
+    so that the conversion happens once at import and not in every test."""
+    return [(template, [_frozen(arg) for arg in args], hyperp)
+            for template, args, hyperp in inputs]
+
+
+QUBIT_CONSTANT_INPUT = _to_arrays(QUBIT_CONSTANT_INPUT)
+CV_CONSTANT_INPUT = _to_arrays(CV_CONSTANT_INPUT)
+
+# names of the keyword arguments that pass the inputs to the kwargs circuits, built once
+# and interned for fast dict lookups; sized for a pair of the templates with the most arguments
+KWARG_KEYS = tuple(sys.intern(str(i)) for i in
+                   range(2 * max(len(args) for _, args, _ in QUBIT_CONSTANT_INPUT + CV_CONSTANT_INPUT)))
+
+
+def kwarg_keys(n):
+    """Names of the keyword arguments that pass ``n`` inputs to the kwargs circuits,
+    falling back to new names if there are more inputs than precomputed names."""
+    if n <= len(KWARG_KEYS):
+        return KWARG_KEYS[:n]
+    return tuple(str(i) for i in range(n))
+
+# constant args of each template, to be reused by other test inputs
+QUBIT_ARGS = {template: args for template, args, _ in QUBIT_CONSTANT_INPUT}
+CV_ARGS = {template: args for template, args, _ in CV_CONSTANT_INPUT}
+
+
+def _pairs(inputs):
+    """Pairs each entry of ``inputs`` with itself and with the next entry (cyclically).
+
+    Every template is combined with a copy of itself, follows a different template and is followed
+    by a different template, without running all ``len(inputs)**2`` combinations.
+
+    Returns a list of tuples ``(template1, template2, inpts, n, hyperp1, hyperp2)``, where ``inpts``
+    are the combined arguments of both templates and ``n`` is the number of arguments of ``template1``."""
+    n = len(inputs)
+    pairs = [(inputs[i], inputs[i]) for i in range(n)]
+    pairs += [(inputs[i], inputs[(i + 1) % n]) for i in range(n) if (i + 1) % n != i]
+    return [(templ1, templ2, args1 + args2, len(args1), hyperp1, hyperp2)
+            for (templ1, args1, hyperp1), (templ2, args2, hyperp2) in pairs]
+
+
+def template_ids(table):
+    """Short test ids for the rows of ``table``, joining the names of the templates and functions
+    in each row, so that pytest does not build ids from the input arrays and hyperparameters."""
+    return ["-".join(v.__name__ for v in row if callable(v)) for row in table]
+
+
+QUBIT_PAIRS = _pairs(QUBIT_CONSTANT_INPUT)
+CV_PAIRS = _pairs(CV_CONSTANT_INPUT)
+
+
+#########################################
+# Devices shared by test classes
+
+
+@pytest.fixture(scope="module")
+def shared_qubit_device_2_wires():
+    """A 2-wire ``default.qubit`` device, shared by all tests of this module, unlike the
+    function-scoped ``qubit_device_2_wires`` fixture of ``conftest.py``.
+
+    QNodes reset the device before each evaluation, so the instance can be reused safely."""
+    return qml.device('default.qubit', wires=2)
+
+
 #########################################
 # Circuits shared by test classes
 
 
 def qnode_qubit_args(dev, intrfc, templ1, templ2, n, hyperp1, hyperp2):
     """QNode for qubit integration circuit using positional arguments"""
-    hyperp1['wires'] = range(2)
-    hyperp2['wires'] = range(2)
+    hyperp1 = {**hyperp1, 'wires': WIRES}
+    hyperp2 = {**hyperp2, 'wires': WIRES}
 
     @qml.qnode(dev, interface=intrfc)
     def circuit(*inp):
@@ -139,15 +269,13 @@ def qnode_qubit_args(dev, intrfc, templ1, templ2, n, hyperp1, hyperp2):
 
 def qnode_qubit_kwargs(dev, intrfc, templ1, templ2, n, hyperp1, hyperp2):
     """QNode for qubit integration circuit using keyword arguments"""
-    hyperp1['wires'] = range(2)
-    hyperp2['wires'] = range(2)
+    hyperp1 = {**hyperp1, 'wires': WIRES}
+    hyperp2 = {**hyperp2, 'wires': WIRES}
 
     @qml.qnode(dev, interface=intrfc)
     def circuit(**inp):
         # Split inputs again
-        ks = [int(k) for k in inp.keys()]
-        vs = inp.values()
-        inp = [x for _, x in sorted(zip(ks, vs))]
+        inp = [inp[key] for key in kwarg_keys(len(inp))]
         inp1 = inp[:n]
         inp2 = inp[n:]
         # Circuit
@@ -162,8 +290,8 @@ def qnode_qubit_kwargs(dev, intrfc, templ1, templ2, n, hyperp1, hyperp2):
 
 def qnode_cv_args(dev, intrfc, templ1, templ2, n, hyperp1, hyperp2):
     """QNode for CV integration circuit using positional arguments"""
-    hyperp1['wires'] = range(2)
-    hyperp2['wires'] = range(2)
+    hyperp1 = {**hyperp1, 'wires': WIRES}
+    hyperp2 = {**hyperp2, 'wires': WIRES}
 
     @qml.qnode(dev, interface=intrfc)
     def circuit(*inp):
@@ -182,15 +310,13 @@ def qnode_cv_args(dev, intrfc, templ1, templ2, n, hyperp1, hyperp2):
 
 def qnode_cv_kwargs(dev, intrfc, templ1, templ2, n, hyperp1, hyperp2):
     """QNode for CV integration circuit using keyword arguments"""
-    hyperp1['wires'] = range(2)
-    hyperp2['wires'] = range(2)
+    hyperp1 = {**hyperp1, 'wires': WIRES}
+    hyperp2 = {**hyperp2, 'wires': WIRES}
 
     @qml.qnode(dev, interface=intrfc)
     def circuit(**inp_):
         # Split inputs again
-        ks = [int(k) for k in inp_.keys()]
-        vs = inp_.values()
-        inp = [x for _, x in sorted(zip(ks, vs))]
+        inp = [inp_[key] for key in kwarg_keys(len(inp_))]
         inp1 = inp[:n]
         inp2 = inp[n:]
         # Circuit
@@ -203,61 +329,85 @@ def qnode_cv_kwargs(dev, intrfc, templ1, templ2, n, hyperp1, hyperp2):
     return circuit
 
 
+#########################################
+# Gradient computations shared by test classes
+
+
+def grad_numpy(circuit, inpts, argnm):
+    """Gradients of a numpy-interface ``circuit`` with respect to the arguments at the indices ``argnm``."""
+    return qml.grad(circuit, argnum=argnm)(*inpts)
+
+
+def grad_torch(circuit, inpts, argnm):
+    """Gradients of a torch-interface ``circuit`` with respect to the arguments at the indices ``argnm``."""
+    from torch.autograd import Variable as TorchVariable
+
+    inpts = [TorchVariable(inp, requires_grad=True) if i in argnm else inp for i, inp in enumerate(inpts)]
+    circuit(*inpts).backward()
+    return [inpts[a].grad.numpy() for a in argnm]
+
+
+def grad_tf(circuit, inpts, argnm):
+    """Gradients of a tf-interface ``circuit`` with respect to the arguments at the indices ``argnm``."""
+    tf = import_tf()
+    grad_inpts = [inpts[a] for a in argnm]
+    with tf.GradientTape() as tape:
+        loss = circuit(*inpts)
+    return tape.gradient(loss, grad_inpts)
+
+
+GRADIENTS = {'numpy': grad_numpy, 'torch': grad_torch, 'tf': grad_tf}
+
+
 ######################
 
 
 class TestIntegrationCircuit:
     """Tests the integration of templates into circuits using different interfaces. """
 
-    @pytest.mark.parametrize("template1, inpts1, hyperp1", QUBIT_CONSTANT_INPUT)
-    @pytest.mark.parametrize("template2, inpts2, hyperp2", QUBIT_CONSTANT_INPUT)
+    @pytest.mark.parametrize("template1, template2, inpts, n, hyperp1, hyperp2", QUBIT_PAIRS,
+                             ids=template_ids(QUBIT_PAIRS))
     @pytest.mark.parametrize("intrfc, to_var", INTERFACES)
-    def test_integration_qubit_args(self, template1, inpts1, template2, inpts2,
+    def test_integration_qubit_args(self, shared_qubit_device_2_wires, template1, template2, inpts, n,
                                     intrfc, to_var, hyperp1, hyperp2):
         """Checks integration of qubit templates using positional arguments."""
-        inpts = inpts1 + inpts2  # Combine inputs to allow passing with *
-        inpts = [to_var(i) for i in inpts]
-        dev = qml.device('default.qubit', wires=2)
-        circuit = qnode_qubit_args(dev, intrfc, template1, template2, len(inpts1), hyperp1, hyperp2)
+        inpts = [convert(to_var, i) for i in inpts]
+        dev = shared_qubit_device_2_wires
+        circuit = qnode_qubit_args(dev, intrfc, template1, template2, n, hyperp1, hyperp2)
         # Check that execution does not throw error
         circuit(*inpts)
 
-    @pytest.mark.parametrize("template1, inpts1, hyperp1", QUBIT_CONSTANT_INPUT)
-    @pytest.mark.parametrize("template2, inpts2, hyperp2", QUBIT_CONSTANT_INPUT)
+    @pytest.mark.parametrize("template1, template2, inpts, n, hyperp1, hyperp2", QUBIT_PAIRS,
+                             ids=template_ids(QUBIT_PAIRS))
     @pytest.mark.parametrize("intrfc, to_var", INTERFACES)
-    def test_integration_qubit_kwargs(self, template1, inpts1, template2, inpts2,
+    def test_integration_qubit_kwargs(self, shared_qubit_device_2_wires, template1, template2, inpts, n,
                                       intrfc, to_var, hyperp1, hyperp2):
         """Checks integration of qubit templates using keyword arguments."""
-        inpts = inpts1 + inpts2  # Combine inputs to allow passing with **
-        inpts = {str(i): to_var(inp) for i, inp in enumerate(inpts)}
-        dev = qml.device('default.qubit', wires=2)
-        circuit = qnode_qubit_kwargs(dev, intrfc, template1, template2, len(inpts1), hyperp1, hyperp2)
+        inpts = {key: convert(to_var, inp) for key, inp in zip(kwarg_keys(len(inpts)), inpts)}
+        dev = shared_qubit_device_2_wires
+        circuit = qnode_qubit_kwargs(dev, intrfc, template1, template2, n, hyperp1, hyperp2)
         # Check that execution does not throw error
         circuit(**inpts)
 
-    @pytest.mark.parametrize("template1, inpts1, hyperp1", CV_CONSTANT_INPUT)
-    @pytest.mark.parametrize("template2, inpts2, hyperp2", CV_CONSTANT_INPUT)
+    @pytest.mark.parametrize("template1, template2, inpts, n, hyperp1, hyperp2", CV_PAIRS, ids=template_ids(CV_PAIRS))
     @pytest.mark.parametrize("intrfc, to_var", INTERFACES)
-    def test_integration_cv_args(self, gaussian_device_2_wires, template1, inpts1, template2, inpts2,
+    def test_integration_cv_args(self, gaussian_device_2_wires, template1, template2, inpts, n,
                                  intrfc, to_var, hyperp1, hyperp2):
         """Checks integration of continuous-variable templates using positional arguments."""
-        inpts = inpts1 + inpts2  # Combine inputs to allow passing with *
-        inpts = [to_var(i) for i in inpts]
+        inpts = [convert(to_var, i) for i in inpts]
         dev = gaussian_device_2_wires
-        circuit = qnode_cv_args(dev, intrfc, template1, template2, len(inpts1), hyperp1, hyperp2)
+        circuit = qnode_cv_args(dev, intrfc, template1, template2, n, hyperp1, hyperp2)
         # Check that execution does not throw error
         circuit(*inpts)
 
-    @pytest.mark.parametrize("template1, inpts1, hyperp1", CV_CONSTANT_INPUT)
-    @pytest.mark.parametrize("template2, inpts2, hyperp2", CV_CONSTANT_INPUT)
+    @pytest.mark.parametrize("template1, template2, inpts, n, hyperp1, hyperp2", CV_PAIRS, ids=template_ids(CV_PAIRS))
     @pytest.mark.parametrize("intrfc, to_var", INTERFACES)
-    def test_integration_cv_kwargs(self, gaussian_device_2_wires, template1, inpts1, template2, inpts2,
+    def test_integration_cv_kwargs(self, gaussian_device_2_wires, template1, template2, inpts, n,
                                    intrfc, to_var, hyperp1, hyperp2):
         """Checks integration of continuous-variable templates using keyword arguments."""
-        inpts = inpts1 + inpts2  # Combine inputs to allow passing with **
-        inpts = {str(i): to_var(inp) for i, inp in enumerate(inpts)}
+        inpts = {key: convert(to_var, inp) for key, inp in zip(kwarg_keys(len(inpts)), inpts)}
         dev = gaussian_device_2_wires
-        circuit = qnode_cv_kwargs(dev, intrfc, template1, template2, len(inpts1), hyperp1, hyperp2)
+        circuit = qnode_cv_kwargs(dev, intrfc, template1, template2, n, hyperp1, hyperp2)
         # Check that execution does not throw error
         circuit(**inpts)
 
@@ -275,11 +425,14 @@ class TestIntegrationCircuitSpecialCases:
                                   (MottonenStatePreparation, [np.array([1 / 2, 1 / 2, 1 / 2, 1 / 2])], {}),
                                   (BasisStatePreparation, [np.array([1, 0])], {})]
 
+    REQUIRE_FIRST_USING_ARGS = _to_arrays(REQUIRE_FIRST_USING_ARGS)
+    REQUIRE_FIRST_USING_KWARGS = _to_arrays(REQUIRE_FIRST_USING_KWARGS)
+
     def qnode_first_op_args(self, dev, intrfc, templ1, templ2, hyperparameters1, hyperparameters2, n):
         """QNode for qubit integration circuit without gates before the first template,
          and using positional arguments"""
-        hyperparameters1['wires'] = range(2)
-        hyperparameters2['wires'] = range(2)
+        hyperparameters1 = {**hyperparameters1, 'wires': WIRES}
+        hyperparameters2 = {**hyperparameters2, 'wires': WIRES}
 
         @qml.qnode(dev, interface=intrfc)
         def circuit(*inp):
@@ -297,15 +450,13 @@ class TestIntegrationCircuitSpecialCases:
     def qnode_first_op_kwargs(self, dev, intrfc, templ1, templ2, hyperparameters1, hyperparameters2, n):
         """QNode for qubit integration circuit without gates before the first template,
          and using keyword arguments"""
-        hyperparameters1['wires'] = range(2)
-        hyperparameters2['wires'] = range(2)
+        hyperparameters1 = {**hyperparameters1, 'wires': WIRES}
+        hyperparameters2 = {**hyperparameters2, 'wires': WIRES}
 
         @qml.qnode(dev, interface=intrfc)
         def circuit(**inp):
             # Split inputs again
-            ks = [int(k) for k in inp.keys()]
-            vs = inp.values()
-            inp = [x for _, x in sorted(zip(ks, vs))]
+            inp = [inp[key] for key in kwarg_keys(len(inp))]
             inp1 = inp[:n]
             inp2 = inp[n:]
             # Circuit
@@ -316,31 +467,35 @@ class TestIntegrationCircuitSpecialCases:
 
         return circuit
 
-    @pytest.mark.parametrize("first_tmpl, first_inpts, first_hyperparams", REQUIRE_FIRST_USING_ARGS)
-    @pytest.mark.parametrize("template, inpts, hyperparams", QUBIT_CONSTANT_INPUT)
+    @pytest.mark.parametrize("first_tmpl, first_inpts, first_hyperparams", REQUIRE_FIRST_USING_ARGS,
+                             ids=template_ids(REQUIRE_FIRST_USING_ARGS))
+    @pytest.mark.parametrize("template, inpts, hyperparams", QUBIT_CONSTANT_INPUT,
+                             ids=template_ids(QUBIT_CONSTANT_INPUT))
     @pytest.mark.parametrize("intrfc, to_var", INTERFACES)
-    def test_integration_first_template_args(self, first_tmpl, first_inpts, first_hyperparams,
-                                             template, inpts, hyperparams, intrfc, to_var):
+    def test_integration_first_template_args(self, shared_qubit_device_2_wires, first_tmpl, first_inpts,
+                                             first_hyperparams, template, inpts, hyperparams, intrfc, to_var):
         """Checks integration of templates that must be the first operation in the circuit while
         using positional arguments."""
         inpts = first_inpts + inpts  # Combine inputs to allow passing with *
-        inpts = [to_var(inp) for inp in inpts]
-        dev = qml.device('default.qubit', wires=2)
+        inpts = [convert(to_var, inp) for inp in inpts]
+        dev = shared_qubit_device_2_wires
         circuit = self.qnode_first_op_args(dev, intrfc, first_tmpl, template, first_hyperparams, hyperparams,
                                            len(first_inpts))
         # Check that execution does not throw error
         circuit(*inpts)
 
-    @pytest.mark.parametrize("first_tmpl, first_inpts, first_hyperparams", REQUIRE_FIRST_USING_KWARGS)
-    @pytest.mark.parametrize("template, inpts, hyperparams", QUBIT_CONSTANT_INPUT)
+    @pytest.mark.parametrize("first_tmpl, first_inpts, first_hyperparams", REQUIRE_FIRST_USING_KWARGS,
+                             ids=template_ids(REQUIRE_FIRST_USING_KWARGS))
+    @pytest.mark.parametrize("template, inpts, hyperparams", QUBIT_CONSTANT_INPUT,
+                             ids=template_ids(QUBIT_CONSTANT_INPUT))
     @pytest.mark.parametrize("intrfc, to_var", INTERFACES)
-    def test_integration_first_template_kwargs(self, first_tmpl, first_inpts, first_hyperparams,
-                                               template, inpts, hyperparams, intrfc, to_var):
+    def test_integration_first_template_kwargs(self, shared_qubit_device_2_wires, first_tmpl, first_inpts,
+                                               first_hyperparams, template, inpts, hyperparams, intrfc, to_var):
         """Checks integration of templates that must be the first operation in the circuit while
         using keyword arguments."""
         inpts = first_inpts + inpts  # Combine inputs to allow passing with *
-        inpts = {str(i): to_var(inp) for i, inp in enumerate(inpts)}
-        dev = qml.device('default.qubit', wires=2)
+        inpts = {key: convert(to_var, inp) for key, inp in zip(kwarg_keys(len(inpts)), inpts)}
+        dev = shared_qubit_device_2_wires
         circuit = self.qnode_first_op_kwargs(dev, intrfc, first_tmpl, template, first_hyperparams, hyperparams,
                                              len(first_inpts))
         # Check that execution does not throw error
@@ -357,31 +512,32 @@ class TestInitializationIntegration:
         return [i for i in range(n)]
 
     # qubit templates, template args, template kwargs, intialization functions, init kwargs
-    qubit_func = [(StronglyEntanglingLayers, [], {'wires': range(2)}, strong_ent_layers_uniform, {'n_layers': 3}),
-                  (StronglyEntanglingLayers, [], {'wires': range(2)}, strong_ent_layers_normal, {'n_layers': 3}),
-                  (RandomLayers, [], {'wires': range(2)}, random_layers_uniform, {'n_layers': 3, 'n_rots': 2}),
-                  (RandomLayers, [], {'wires': range(2)}, random_layers_normal, {'n_layers': 3, 'n_rots': 2}),
-                  (QAOAEmbedding, [[1., 2.]], {'wires': range(2)}, qaoa_embedding_uniform, {'n_layers': 3}),
-                  (QAOAEmbedding, [[1., 2.]], {'wires': range(2)}, qaoa_embedding_normal, {'n_layers': 3})]
+    qubit_func = [(StronglyEntanglingLayers, [], {'wires': WIRES}, strong_ent_layers_uniform, {'n_layers': 3}),
+                  (StronglyEntanglingLayers, [], {'wires': WIRES}, strong_ent_layers_normal, {'n_layers': 3}),
+                  (RandomLayers, [], {'wires': WIRES}, random_layers_uniform, {'n_layers': 3, 'n_rots': 2}),
+                  (RandomLayers, [], {'wires': WIRES}, random_layers_normal, {'n_layers': 3, 'n_rots': 2}),
+                  (QAOAEmbedding, [[1., 2.]], {'wires': WIRES}, qaoa_embedding_uniform, {'n_layers': 3}),
+                  (QAOAEmbedding, [[1., 2.]], {'wires': WIRES}, qaoa_embedding_normal, {'n_layers': 3})]
 
     # cv templates, template args, template kwargs, intialization functions, init kwargs
-    cv_func = [(CVNeuralNetLayers, [], {'wires': range(2)}, cvqnn_layers_all, {'n_layers': 3}),
-               (Interferometer, [], {'wires': range(2)}, interferometer_all, {})]
+    cv_func = [(CVNeuralNetLayers, [], {'wires': WIRES}, cvqnn_layers_all, {'n_layers': 3}),
+               (Interferometer, [], {'wires': WIRES}, interferometer_all, {})]
 
-    @pytest.mark.parametrize("template, args, kwargs, init, kwargs_init", qubit_func)
-    def test_integration_qubit_init(self, template, args, kwargs, init, kwargs_init):
+    @pytest.mark.parametrize("template, args, kwargs, init, kwargs_init", qubit_func, ids=template_ids(qubit_func))
+    def test_integration_qubit_init(self, shared_qubit_device_2_wires, template, args, kwargs, init, kwargs_init):
         """Checks parameter initialization compatible with qubit templates."""
         wires = kwargs['wires']
+        # the rows of the table use ``WIRES``, matching the 2-wire device
+        assert len(wires) == 2
         # choose n_wires for init function same as in template
-        kwargs_init['n_wires'] = len(wires)
+        kwargs_init = {**kwargs_init, 'n_wires': len(wires)}
         inp = init(**kwargs_init)
         if not isinstance(inp, list):
             # Wrap single outputs for consistent unpacking
             inp = [inp]
-        # set init function's output as weights
-        for i in inp:
-            args.append(i) #TODO: This strategy only works when the init function produces the last of the args
-        dev = qml.device('default.qubit', wires=len(wires))
+        # set init function's output as weights, without changing the shared parameter lists
+        args = args + inp #TODO: This strategy only works when the init function produces the last of the args
+        dev = shared_qubit_device_2_wires
         @qml.qnode(dev)
         def circuit():
             template(*args, **kwargs)
@@ -389,20 +545,21 @@ class TestInitializationIntegration:
         # Check that execution does not throw error
         circuit()
 
-    @pytest.mark.parametrize("template, args, kwargs, init, kwargs_init", cv_func)
-    def test_integration_cv_init(self, gaussian_dummy, template, args, kwargs, init, kwargs_init):
+    @pytest.mark.parametrize("template, args, kwargs, init, kwargs_init", cv_func, ids=template_ids(cv_func))
+    def test_integration_cv_init(self, gaussian_device_2_wires, template, args, kwargs, init, kwargs_init):
         """Checks parameter initialization compatible with continuous-variable templates."""
         wires = kwargs['wires']
+        # the rows of the table use ``WIRES``, matching the 2-wire device
+        assert len(wires) == 2
         # choose n_wires for init function same as in template
-        kwargs_init['n_wires'] = len(wires)
+        kwargs_init = {**kwargs_init, 'n_wires': len(wires)}
         inp = init(**kwargs_init)
         if not isinstance(inp, list):
             # Wrap single outputs for consistent unpacking
             inp = [inp]
-        # set init function's output as weights
-        for i in inp:
-            args.append(i) #TODO: This strategy only works when the init function produces the last of the args
-        dev = gaussian_dummy(len(wires))
+        # set init function's output as weights, without changing the shared parameter lists
+        args = args + inp #TODO: This strategy only works when the init function produces the last of the args
+        dev = gaussian_device_2_wires
         @qml.qnode(dev)
         def circuit():
             template(*args, **kwargs)
@@ -415,95 +572,66 @@ class TestGradientIntegration:
     """Tests that gradients of circuits with templates can be computed."""
 
     # qubit templates, constant inputs, kwargs, and ``argnum`` argument of qml.grad
-    QUBIT_GRADIENT_INPUT = [(StronglyEntanglingLayers, [[[[4.54, 4.79, 2.98], [4.93, 4.11, 5.58]],
-                                                         [[6.08, 5.94, 0.05], [2.44, 5.07, 0.95]]]],
-                             {'wires': range(2)}, [0]),
-                            (RandomLayers, [[[0.56, 5.14], [2.21, 4.27]]], {'wires': range(2)}, [0]),
-                            (AngleEmbedding, [[1., 2.]], {'wires': range(2)}, [0]),
-                            (QAOAEmbedding, [[1., 2.], [[0.1, 0.1, 0.1]]], {'wires': range(2)}, [0]),
-                            (QAOAEmbedding, [[1., 2.], [[0.1, 0.1, 0.1]]], {'wires': range(2)}, [1])
+    QUBIT_GRADIENT_INPUT = [(StronglyEntanglingLayers, QUBIT_ARGS[StronglyEntanglingLayers], {'wires': WIRES}, [0]),
+                            (RandomLayers, QUBIT_ARGS[RandomLayers], {'wires': WIRES}, [0]),
+                            (AngleEmbedding, QUBIT_ARGS[AngleEmbedding], {'wires': WIRES}, [0]),
+                            (QAOAEmbedding, QUBIT_ARGS[QAOAEmbedding], {'wires': WIRES}, [0]),
+                            (QAOAEmbedding, QUBIT_ARGS[QAOAEmbedding], {'wires': WIRES}, [1])
                             ]
 
     # cv templates, constant inputs, kwargs, and ``argnum`` argument of qml.grad
-    CV_GRADIENT_INPUT = [(DisplacementEmbedding, [[1., 2.]], {'wires': range(2)}, [0]),
-                         (SqueezingEmbedding, [[1., 2.]], {'wires': range(2)}, [0]),
-                         (CVNeuralNetLayers, [[[2.31], [1.22]],
-                                    [[3.47], [2.01]],
-                                    [[0.93, 1.58], [5.07, 4.82]],
-                                    [[0.21, 0.12], [-0.09, 0.04]],
-                                    [[4.76, 6.08], [6.09, 6.22]],
-                                    [[4.83], [1.70]],
-                                    [[4.74], [5.39]],
-                                    [[0.88, 0.62], [1.09, 3.02]],
-                                    [[-0.01, -0.05], [0.08, -0.19]],
-                                    [[1.89, 3.59], [1.49, 3.71]],
-                                    [[0.09, 0.03], [-0.14, 0.04]]
-                                    ], {'wires': range(2)}, list(range(11))),
-                         (Interferometer, [[2.31], [3.49], [0.98, 1.54]], {'wires': range(2)}, [0, 1, 2])
+    CV_GRADIENT_INPUT = [(DisplacementEmbedding, CV_ARGS[DisplacementEmbedding], {'wires': WIRES}, [0]),
+                         (SqueezingEmbedding, CV_ARGS[SqueezingEmbedding], {'wires': WIRES}, [0]),
+                         (CVNeuralNetLayers, CV_ARGS[CVNeuralNetLayers], {'wires': WIRES}, list(range(11))),
+                         (Interferometer, CV_ARGS[Interferometer], {'wires': WIRES}, [0, 1, 2])
                          ]
 
-    @pytest.mark.parametrize("template, inpts, hyperp, argnm", QUBIT_GRADIENT_INPUT)
-    @pytest.mark.parametrize("intrfc, to_var", INTERFACES)
-    def test_integration_qubit_grad(self, template, inpts, hyperp, argnm, intrfc, to_var):
+    @pytest.mark.parametrize("template, inpts, hyperp, argnm", QUBIT_GRADIENT_INPUT,
+                             ids=template_ids(QUBIT_GRADIENT_INPUT))
+    @pytest.mark.parametrize("intrfc, to_var", GRADIENT_INTERFACES)
+    def test_integration_qubit_grad(self, shared_qubit_device_2_wires, fast_grad, skip_heavy_grad, template, inpts,
+                                    hyperp, argnm, intrfc, to_var):
         """Checks that gradient calculations of qubit templates execute without error."""
-        inpts = [to_var(i) for i in inpts]
-        n_wires = len(hyperp['wires'])
-        dev = qml.device('default.qubit', wires=n_wires)
+        inpts = [convert(to_var, i) for i in inpts]
+        dev = shared_qubit_device_2_wires
         @qml.qnode(dev, interface=intrfc)
         def circuit(*inp):
             template(*inp, **hyperp)
             return qml.expval(qml.Identity(0))
 
-        # Check gradients in numpy interface
-        if intrfc == 'numpy':
-            grd = qml.grad(circuit, argnum=argnm)
-            grd(*inpts)
-
-        # Check gradients in torch interface
-        if intrfc == 'torch':
-            for a in argnm:
-                inpts[a] = TorchVariable(inpts[a], requires_grad=True)
-            res = circuit(*inpts)
-            res.backward()
-            for a in argnm:
-                inpts[a].grad.numpy()
-
-        # Check gradients in tf interface
-        if intrfc == 'tf':
-            grad_inpts = [inpts[a] for a in argnm]
-            with tf.GradientTape() as tape:
-                loss = circuit(*inpts)
-                tape.gradient(loss, grad_inpts)
-
-    @pytest.mark.parametrize("template, inpts, hyperp, argnm", CV_GRADIENT_INPUT)
-    @pytest.mark.parametrize("intrfc, to_var", INTERFACES)
-    def test_integration_cv_grad(self, gaussian_dummy, template, inpts, hyperp, argnm, intrfc, to_var):
+        if skip_heavy_grad and intrfc != 'numpy':
+            # the numpy rows check the gradients, the other interfaces only run the circuit
+            circuit(*inpts)
+            pytest.skip("gradients only computed with --full-grad-interfaces")
+
+        if fast_grad and intrfc != 'numpy':
+            # full gradients of the templates are checked in the numpy rows
+            argnm = argnm[:1]
+
+        # Check that gradient computation does not throw error
+        GRADIENTS[intrfc](circuit, inpts, argnm)
+
+    @pytest.mark.parametrize("template, inpts, hyperp, argnm", CV_GRADIENT_INPUT, ids=template_ids(CV_GRADIENT_INPUT))
+    @pytest.mark.parametrize("intrfc, to_var", GRADIENT_INTERFACES)
+    def test_integration_cv_grad(self, gaussian_device_2_wires, fast_grad, skip_heavy_grad, template, inpts, hyperp,
+                                 argnm, intrfc, to_var):
         """Checks that gradient calculations of cv templates execute without error."""
-        inpts = [to_var(i) for i in inpts]
-        n_wires = len(hyperp['wires'])
-        dev = gaussian_dummy(n_wires)
+        inpts = [convert(to_var, i) for i in inpts]
+        dev = gaussian_device_2_wires
         @qml.qnode(dev, interface=intrfc)
         def circuit(*inp):
             template(*inp, **hyperp)
             return qml.expval(qml.Identity(0))
 
-        # Check gradients in numpy interface
-        if intrfc == 'numpy':
-            grd = qml.grad(circuit, argnum=argnm)
-            assert grd(*inpts) is not None
-
-        # Check gradients in torch interface
-        if intrfc == 'torch':
-            for a in argnm:
-                inpts[a] = TorchVariable(inpts[a], requires_grad=True)
-            res = circuit(*inpts)
-            res.backward()
-            for a in argnm:
-                assert inpts[a].grad.numpy() is not None
-
-        # Check gradients in tf interface
-        if intrfc == 'tf':
-            grad_inpts = [inpts[a] for a in argnm]
-            with tf.GradientTape() as tape:
-                loss = circuit(*inpts)
-                assert tape.gradient(loss, grad_inpts) is not None
+        if skip_heavy_grad and intrfc != 'numpy':
+            # the numpy rows check the gradients, the other interfaces only run the circuit
+            circuit(*inpts)
+            pytest.skip("gradients only computed with --full-grad-interfaces")
+
+        if fast_grad and intrfc != 'numpy':
+            # full gradients of the templates are checked in the numpy rows
+            argnm = argnm[:1]
+
+        # Check that gradient computation does not throw error
+        grads = GRADIENTS[intrfc](circuit, inpts, argnm)
+        assert all(g is not None for g in grads)
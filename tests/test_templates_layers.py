@@ -26,14 +26,56 @@ from pennylane.templates.layers import (CVNeuralNetLayers,
 from pennylane import RX, RY, RZ, CZ, CNOT
 
 
+# number of random weights needed by the largest test
+N_RANDOM_WEIGHTS = 500
+
+
+@pytest.fixture(scope="module")
+def weight_buffer():
+    """Normally distributed numbers from which the tests take their random weights,
+    generated once for the module by a local generator, independently of the global random state."""
+    return np.random.default_rng(0).standard_normal(N_RANDOM_WEIGHTS)
+
+
+def random_weights(buffer, *shape):
+    """Returns a view of the first entries of ``buffer`` with the given shape."""
+    return buffer[:int(np.prod(shape))].reshape(shape)
+
+
+@pytest.fixture(scope="module")
+def qubit_devices():
+    """Returns a function that provides a ``default.qubit`` device for a number of wires,
+    creating each device once for the module."""
+    devices = {}
+
+    def get_device(n_wires):
+        if n_wires not in devices:
+            devices[n_wires] = qml.device('default.qubit', wires=n_wires)
+        return devices[n_wires]
+
+    return get_device
+
+
+def gate_mask(queue, gate):
+    """Boolean array marking the operations in ``queue`` that are instances of ``gate``."""
+    return np.fromiter((isinstance(op, gate) for op in queue), dtype=bool, count=len(queue))
+
+
+# fixed number of modes and layers of the handcoded CVNeuralNet weights
+CV_N_MODES = 4
+CV_N_LAYERS = 2
+
+# groups of gates BS-R-S-BS-R-D in a CVNeuralNet layer, their positions in a layer on four modes,
+# and number of gates per layer, including the final Kerr gates
+CV_LAYER_GATES = (qml.Beamsplitter, qml.Rotation, qml.Squeezing,
+                  qml.Beamsplitter, qml.Rotation, qml.Displacement)
+CV_LAYER_SLICES = ((0, 6), (6, 10), (10, 14), (14, 20), (20, 24), (24, 28))
+CV_LAYER_STRIDE = 32
+
+
 class TestCVNeuralNet:
     """Tests for the CVNeuralNet from the pennylane.template module."""
 
-    # Have a fixed number of subsystems in this handcoded test
-    @pytest.fixture(scope="class")
-    def num_subsystems(self):
-        return 4
-
     @pytest.fixture(scope="class")
     def weights(self):
         return [
@@ -65,49 +107,26 @@ class TestCVNeuralNet:
         """Tests that the CVNeuralNetLayers template uses the weigh parameters correctly."""
 
         with qml.utils.OperationRecorder() as rec:
-            CVNeuralNetLayers(*weights, wires=range(4))
+            CVNeuralNetLayers(*weights, wires=range(CV_N_MODES))
 
         # Test that gates appear in the right order for each layer:
         # BS-R-S-BS-R-D-K
-        for l in range(2):
-            gates = [qml.Beamsplitter, qml.Rotation, qml.Squeezing,
-                     qml.Beamsplitter, qml.Rotation, qml.Displacement]
-
-            # count the position of each group of gates in the layer
-            num_gates_per_type = [0, 6, 4, 4, 6, 4, 4, 4]
-            s = np.cumsum(num_gates_per_type)
-            gc = l*sum(num_gates_per_type)+np.array(list(zip(s[:-1], s[1:])))
+        # indices of the weights used by each group of gates
+        weight_idx = [(0, 1), (2,), (3, 4), (5, 6), (7,), (8, 9)]
 
+        for l in range(CV_N_LAYERS):
             # loop through expected gates
-            for idx, g in enumerate(gates):
-                # loop through where these gates should be in the queue
-                for opidx, op in enumerate(rec.queue[gc[idx, 0]:gc[idx, 1]]):
-                    # check that op in queue is correct gate
-                    assert isinstance(op, g)
-
-                    # test that the parameters are correct
-                    res_params = op.parameters
-
-                    if idx == 0:
-                        # first BS
-                        exp_params = [weights[0][l][opidx], weights[1][l][opidx]]
-                    elif idx == 1:
-                        # first rot
-                        exp_params = [weights[2][l][opidx]]
-                    elif idx == 2:
-                        # squeezing
-                        exp_params = [weights[3][l][opidx], weights[4][l][opidx]]
-                    elif idx == 3:
-                        # second BS
-                        exp_params = [weights[5][l][opidx], weights[6][l][opidx]]
-                    elif idx == 4:
-                        # second rot
-                        exp_params = [weights[7][l][opidx]]
-                    elif idx == 5:
-                        # displacement
-                        exp_params = [weights[8][l][opidx], weights[9][l][opidx]]
-
-                    assert res_params == exp_params
+            for idx, g in enumerate(CV_LAYER_GATES):
+                start, stop = CV_LAYER_SLICES[idx]
+                ops = rec.queue[l*CV_LAYER_STRIDE+start:l*CV_LAYER_STRIDE+stop]
+
+                # check that ops in queue are the correct gate
+                assert all(isinstance(op, g) for op in ops)
+
+                # test that the parameters of all gates of the group are correct
+                res_params = np.array([op.parameters for op in ops])
+                exp_params = np.stack([weights[w][l] for w in weight_idx[idx]], axis=1)
+                assert np.array_equal(res_params, exp_params)
 
     def test_cvqnn_layers_exception_nlayers(self, gaussian_device_4modes):
         """Integration test for the CVNeuralNetLayers method."""
@@ -126,14 +145,12 @@ class TestCVNeuralNet:
 class TestStronglyEntangling:
     """Tests for the StronglyEntanglingLayers method from the pennylane.templates.layers module."""
 
-    def test_strong_ent_layers_uses_correct_weights(self, n_subsystems):
+    def test_strong_ent_layers_uses_correct_weights(self, weight_buffer, n_subsystems):
         """Test that StronglyEntanglingLayers uses the correct weights in the circuit."""
-        np.random.seed(12)
         n_layers = 2
         num_wires = n_subsystems
 
-        dev = qml.device('default.qubit', wires=num_wires)
-        weights = np.random.randn(n_layers, num_wires, 3)
+        weights = random_weights(weight_buffer, n_layers, num_wires, 3)
 
         with qml.utils.OperationRecorder() as rec:
             StronglyEntanglingLayers(weights, wires=range(num_wires))
@@ -156,25 +173,24 @@ class TestStronglyEntangling:
                 exp_params = weights[l, n, :]
                 assert sum([r == e for r, e in zip(res_params, exp_params)])
 
-    def test_strong_ent_layers_uses_correct_number_of_imprimitives(self, n_layers, n_subsystems):
+    def test_strong_ent_layers_uses_correct_number_of_imprimitives(self, weight_buffer, n_layers, n_subsystems):
         """Test that StronglyEntanglingLayers uses the correct number of imprimitives."""
         imprimitive = CZ
-        dev = qml.device('default.qubit', wires=n_subsystems)
-        weights = np.random.randn(n_layers, n_subsystems, 3)
+        weights = random_weights(weight_buffer, n_layers, n_subsystems, 3)
 
         with qml.utils.OperationRecorder() as rec:
             StronglyEntanglingLayers(weights=weights, wires=range(n_subsystems), imprimitive=imprimitive)
 
-        types = [type(q) for q in rec.queue]
-        assert types.count(imprimitive) == n_subsystems*n_layers
+        assert gate_mask(rec.queue, imprimitive).sum() == n_subsystems*n_layers
 
     @pytest.mark.parametrize("n_wires, n_layers, ranges", [(2, 2, [2, 1]),
                                                            (3, 1, [5])])
-    def test_strong_ent_layers_ranges_equals_wires_exception(self, n_layers, n_wires, ranges):
+    def test_strong_ent_layers_ranges_equals_wires_exception(self, qubit_devices, weight_buffer, n_layers, n_wires,
+                                                             ranges):
         """Test that StronglyEntanglingLayers throws and exception if a range is equal to or
         larger than the number of wires."""
-        dev = qml.device('default.qubit', wires=n_wires)
-        weights = np.random.randn(n_layers, n_wires, 3)
+        dev = qubit_devices(n_wires)
+        weights = random_weights(weight_buffer, n_layers, n_wires, 3)
 
         def circuit(weights):
             StronglyEntanglingLayers(weights=weights, wires=range(n_wires), ranges=ranges)
@@ -185,12 +201,12 @@ class TestStronglyEntangling:
         with pytest.raises(ValueError, match="The range hyperparameter for all layers needs to be smaller than"):
             qnode(weights)
 
-    def test_strong_ent_layers_illegal_ranges_exception(self):
+    def test_strong_ent_layers_illegal_ranges_exception(self, qubit_devices, weight_buffer):
         """Test that StronglyEntanglingLayers throws and exception if ``ranges`` parameter of illegal type."""
         n_wires = 2
         n_layers = 2
-        dev = qml.device('default.qubit', wires=n_wires)
-        weights = np.random.randn(n_layers, n_wires, 3)
+        dev = qubit_devices(n_wires)
+        weights = random_weights(weight_buffer, n_layers, n_wires, 3)
 
         def circuit(weights):
             StronglyEntanglingLayers(weights=weights, wires=range(n_wires), ranges=['a', 'a'])
@@ -203,12 +219,12 @@ class TestStronglyEntangling:
 
     @pytest.mark.parametrize("n_layers, ranges", [(2, [1, 2, 4]),
                                                   (5, [2])])
-    def test_strong_ent_layers_wrong_size_ranges_exception(self, n_layers, ranges):
+    def test_strong_ent_layers_wrong_size_ranges_exception(self, qubit_devices, weight_buffer, n_layers, ranges):
         """Test that StronglyEntanglingLayers throws and exception if ``ranges`` parameter
         not of shape (len(wires),)."""
         n_wires = 5
-        dev = qml.device('default.qubit', wires=n_wires)
-        weights = np.random.randn(n_layers, n_wires, 3)
+        dev = qubit_devices(n_wires)
+        weights = random_weights(weight_buffer, n_layers, n_wires, 3)
 
         def circuit(weights):
             StronglyEntanglingLayers(weights=weights, wires=range(n_wires), ranges=ranges)
@@ -224,166 +240,119 @@ class TestStronglyEntangling:
 class TestRandomLayers:
     """Tests for the RandomLayers method from the pennylane.templates module."""
 
-    @pytest.fixture(scope="class",
-                    params=[0.2, 0.6])
-    def ratio(self, request):
-        return request.param
-
-    @pytest.fixture(scope="class",
-                    params=[CNOT, CZ])
-    def impr(self, request):
-        return request.param
-
-    @pytest.fixture(scope="class",
-                    params=[[RX], [RY, RZ]])
-    def rots(self, request):
-        return request.param
+    @pytest.fixture(scope="class")
+    def random_qnode(self, qubit_devices):
+        """QNode applying RandomLayers to two qubits, built once for the tests of the class.
 
-    def test_random_layers_deterministic_seed(self, n_layers, tol, seed):
-        """Test that RandomLayers() acts deterministically when using fixed seed."""
-        n_rots = 1
+        The seed is passed as a keyword argument, so that the same QNode serves all seeds;
+        if it is not given, RandomLayers uses its default seed."""
         n_wires = 2
-        dev = qml.device('default.qubit', wires=n_wires)
-        weights = np.random.randn(n_layers, n_rots)
-
-        def circuit1(weights):
-            RandomLayers(weights=weights, wires=range(n_wires), seed=seed)
-            return qml.expval(qml.PauliZ(0))
+        dev = qubit_devices(n_wires)
 
-        def circuit2(weights):
-            RandomLayers(weights=weights, wires=range(n_wires), seed=seed)
+        def circuit(weights, seed=None):
+            seed_kwarg = {} if seed is None else {'seed': seed}
+            RandomLayers(weights=weights, wires=range(n_wires), **seed_kwarg)
             return qml.expval(qml.PauliZ(0))
 
-        qnode1 = qml.QNode(circuit1, dev)
-        qnode2 = qml.QNode(circuit2, dev)
-        assert np.allclose(qnode1(weights), qnode2(weights), atol=tol)
+        return qml.QNode(circuit, dev)
 
-    def test_random_layers_deterministic_default_seed(self, n_layers, tol):
-        """Test that RandomLayers() acts deterministically when using default seed."""
+    def test_random_layers_deterministic_seed(self, weight_buffer, random_qnode, n_layers, tol, seed):
+        """Test that RandomLayers() acts deterministically when using fixed seed."""
         n_rots = 1
-        n_wires = 2
-        dev = qml.device('default.qubit', wires=n_wires)
-        weights = np.random.randn(n_layers, n_rots)
-
-        def circuit1(weights):
-            RandomLayers(weights=weights, wires=range(n_wires))
-            return qml.expval(qml.PauliZ(0))
+        weights = random_weights(weight_buffer, n_layers, n_rots)
 
-        def circuit2(weights):
-            RandomLayers(weights=weights, wires=range(n_wires))
-            return qml.expval(qml.PauliZ(0))
+        assert np.allclose(random_qnode(weights, seed=seed), random_qnode(weights, seed=seed), atol=tol)
 
-        qnode1 = qml.QNode(circuit1, dev)
-        qnode2 = qml.QNode(circuit2, dev)
+    def test_random_layers_deterministic_default_seed(self, weight_buffer, random_qnode, n_layers, tol):
+        """Test that RandomLayers() acts deterministically when using default seed."""
+        n_rots = 1
+        weights = random_weights(weight_buffer, n_layers, n_rots)
 
-        assert np.allclose(qnode1(weights), qnode2(weights), atol=tol)
+        assert np.allclose(random_qnode(weights), random_qnode(weights), atol=tol)
 
-    def test_random_layers_two_seeds_different(self, n_layers, tol):
+    def test_random_layers_two_seeds_different(self, weight_buffer, random_qnode, n_layers, tol):
         """Test that RandomLayers() does not have the same output for two different seeds."""
         n_rots = 10
-        n_wires = 2
-        dev = qml.device('default.qubit', wires=n_wires)
-        weights = np.random.randn(n_layers, n_rots)
-
-        def circuit1(weights):
-            RandomLayers(weights=weights, wires=range(n_wires), seed=0)
-            return qml.expval(qml.PauliZ(0))
-
-        def circuit2(weights):
-            RandomLayers(weights=weights, wires=range(n_wires), seed=1)
-            return qml.expval(qml.PauliZ(0))
-
-        qnode1 = qml.QNode(circuit1, dev)
-        qnode2 = qml.QNode(circuit2, dev)
+        weights = random_weights(weight_buffer, n_layers, n_rots)
 
-        assert not np.allclose(qnode1(weights), qnode2(weights), atol=tol)
+        assert not np.allclose(random_qnode(weights, seed=0), random_qnode(weights, seed=1), atol=tol)
 
-    def test_random_layers_nlayers(self, n_layers):
+    def test_random_layers_nlayers(self, weight_buffer, n_layers):
         """Test that RandomLayers() picks the correct number of gates."""
-        np.random.seed(12)
         n_rots = 1
         n_wires = 2
         impr = CNOT
-        dev = qml.device('default.qubit', wires=n_wires)
-        weights = np.random.randn(n_layers, n_rots)
+        weights = random_weights(weight_buffer, n_layers, n_rots)
 
         with qml.utils.OperationRecorder() as rec:
             RandomLayers(weights=weights, wires=range(n_wires))
 
-        types = [type(q) for q in rec.queue]
-        assert len(types) - types.count(impr) == n_layers
+        assert (~gate_mask(rec.queue, impr)).sum() == n_layers
 
-    def test_random_layer_ratio_imprimitive(self, ratio):
+    @pytest.mark.parametrize("ratio", [0.2, 0.6])
+    def test_random_layer_ratio_imprimitive(self, weight_buffer, ratio):
         """Test that  _random_layer() has the right ratio of imprimitive gates."""
         n_rots = 500
         n_wires = 2
         impr = CNOT
-        dev = qml.device('default.qubit', wires=n_wires)
-        weights = np.random.randn(n_rots)
+        weights = random_weights(weight_buffer, n_rots)
 
         with qml.utils.OperationRecorder() as rec:
             _random_layer(weights=weights, wires=range(n_wires), ratio_imprim=ratio,
                           imprimitive=CNOT, rotations=[RX, RY, RZ], seed=42)
 
-        types = [type(q) for q in rec.queue]
-        ratio_impr = types.count(impr) / len(types)
+        ratio_impr = gate_mask(rec.queue, impr).mean()
         assert np.isclose(ratio_impr, ratio, atol=0.05)
 
-    def test_random_layer_gate_types(self, n_subsystems, impr, rots):
+    @pytest.mark.parametrize("impr", [CNOT, CZ])
+    @pytest.mark.parametrize("rots", [[RX], [RY, RZ]])
+    def test_random_layer_gate_types(self, weight_buffer, n_subsystems, impr, rots):
         """Test that  _random_layer() uses the correct types of gates."""
         n_rots = 20
-        dev = qml.device('default.qubit', wires=n_subsystems)
-        weights = np.random.randn(n_rots)
+        weights = random_weights(weight_buffer, n_rots)
 
         with qml.utils.OperationRecorder() as rec:
             _random_layer(weights=weights, wires=range(n_subsystems), ratio_imprim=0.3,
                           imprimitive=impr, rotations=rots, seed=42)
 
-        types = [type(q) for q in rec.queue]
-        unique = set(types)
-        gates = {impr, *rots}
-        assert unique == gates
+        masks = [gate_mask(rec.queue, g) for g in (impr, *rots)]
+        # each operation is one of the gates, and each gate is used
+        assert np.any(masks, axis=0).all()
+        assert all(mask.any() for mask in masks)
 
-    def test_random_layer_numgates(self, n_subsystems):
+    def test_random_layer_numgates(self, weight_buffer, n_subsystems):
         """Test that _random_layer() uses the correct number of gates."""
         n_rots = 5
-        dev = qml.device('default.qubit', wires=n_subsystems)
-        weights = np.random.randn(n_rots)
+        weights = random_weights(weight_buffer, n_rots)
 
         with qml.utils.OperationRecorder() as rec:
             _random_layer(weights=weights, wires=range(n_subsystems), ratio_imprim=0.3,
                           imprimitive=qml.CNOT, rotations=[RX, RY, RZ], seed=42)
 
-        types = [type(q) for q in rec.queue]
-        assert len(types) - types.count(qml.CNOT) == n_rots
+        assert (~gate_mask(rec.queue, qml.CNOT)).sum() == n_rots
 
-    def test_random_layer_randomwires(self, n_subsystems):
+    def test_random_layer_randomwires(self, weight_buffer, n_subsystems):
         """Test that  _random_layer() picks random wires."""
         n_rots = 500
-        dev = qml.device('default.qubit', wires=n_subsystems)
-        weights = np.random.randn(n_rots)
+        weights = random_weights(weight_buffer, n_rots)
 
         with qml.utils.OperationRecorder() as rec:
             _random_layer(weights=weights, wires=range(n_subsystems), ratio_imprim=0.3,
                           imprimitive=qml.CNOT, rotations=[RX, RY, RZ], seed=42)
 
-        wires = [q._wires for q in rec.queue]
-        wires_flat = [item for w in wires for item in w]
-        mean_wire = np.mean(wires_flat)
+        wires_flat = np.fromiter((w for q in rec.queue for w in q._wires), dtype=int)
+        mean_wire = wires_flat.mean()
         assert np.isclose(mean_wire, (n_subsystems - 1) / 2, atol=0.05)
 
-    def test_random_layer_weights(self, n_subsystems, tol):
+    def test_random_layer_weights(self, weight_buffer, n_subsystems, tol):
         """Test that _random_layer() uses the correct weights."""
-        np.random.seed(12)
         n_rots = 5
-        dev = qml.device('default.qubit', wires=n_subsystems)
-        weights = np.random.randn(n_rots)
+        weights = random_weights(weight_buffer, n_rots)
 
         with qml.utils.OperationRecorder() as rec:
             _random_layer(weights=weights, wires=range(n_subsystems), ratio_imprim=0.3,
                           imprimitive=qml.CNOT, rotations=[RX, RY, RZ], seed=4)
 
-        params = [q.parameters for q in rec.queue]
-        params_flat = [item for p in params for item in p]
+        params_flat = np.fromiter((p for q in rec.queue for p in q.parameters), dtype=float)
         assert np.allclose(weights.flatten(), params_flat, atol=tol)
 